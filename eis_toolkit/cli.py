@@ -1583,6 +1583,7 @@ def unify_rasters_cli(
             rasters_to_unify=to_unify,
             resampling_method=get_enum_values(resampling_method),
             masking=None if masking_param == "none" else masking_param,
+            read_base_raster=False,
         )
         [rstr.close() for rstr in to_unify]  # Close all rasters
     typer.echo("Progress: 75%")
@@ -5,6 +5,7 @@ from beartype.typing import Tuple
 
 from eis_toolkit.raster_processing.unifying import unify_raster_grids
 from eis_toolkit.utilities.checks.raster import check_raster_grids
+from eis_toolkit.utilities.raster import get_output_dtype
 
 
 @beartype
@@ -26,7 +27,8 @@ def mask_raster(
         base_raster: The base raster used to determine nodata locations.
 
     Returns:
-        The masked raster data.
+        The masked raster data. If the raster has no nodata value and its data type cannot represent NaN,
+            the data is converted to float64 and masked pixels are set to NaN.
         The raster profile.
     """
     raster_profile = raster.profile
@@ -38,7 +40,11 @@ def mask_raster(
         raster_arr = raster.read()
     else:
         out_rasters = unify_raster_grids(
-            base_raster=base_raster, rasters_to_unify=[raster], resampling_method="nearest", masking="extents"
+            base_raster=base_raster,
+            rasters_to_unify=[raster],
+            resampling_method="nearest",
+            masking="extents",
+            read_base_raster=False,
         )
         raster_arr = out_rasters[1][0]
 
@@ -46,8 +52,10 @@ def mask_raster(
         raster_profile = out_rasters[1][1]
         profiles[0] = raster_profile
 
-    # Extract nodata info
-    raster_nodata = raster_profile.get("nodata", np.nan)
+    # Extract nodata info, masked pixels are set to NaN if the raster has no nodata value
+    raster_nodata = raster_profile.get("nodata")
+    if raster_nodata is None:
+        raster_nodata = np.nan
     base_raster_nodata = base_raster_profile.get("nodata", np.nan)
 
     # Create mask to apply
@@ -56,11 +64,12 @@ def mask_raster(
 
     # Apply mask to all bands of input raster
     bands = raster.count
-    out_image = np.empty((bands, raster_profile["height"], raster_profile["width"]), dtype=raster_profile["dtype"])
+    out_dtype = get_output_dtype(raster_nodata, raster_profile["dtype"])
+    out_image = np.empty((bands, raster_profile["height"], raster_profile["width"]), dtype=out_dtype)
     for i in range(bands):
-        band_arr = raster_arr[i]
-        band_arr[base_raster_nodata_mask] = raster_nodata
-        out_image[i] = band_arr
+        out_image[i] = raster_arr[i]
+        out_image[i][base_raster_nodata_mask] = raster_nodata
 
     out_profile = raster_profile.copy()
+    out_profile["dtype"] = out_dtype.name
     return out_image, out_profile
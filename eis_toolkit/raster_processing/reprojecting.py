@@ -6,6 +6,7 @@ from rasterio import warp
 
 from eis_toolkit.exceptions import MatchingCrsException
 from eis_toolkit.raster_processing.resampling import RESAMPLE_METHOD_MAP
+from eis_toolkit.utilities.raster import get_output_dtype
 
 
 # Core reprojecting functionality used internally by reproject_raster and reproject_and_write_raster
@@ -24,9 +25,9 @@ def _reproject_raster(
         *raster.bounds,
     )
 
-    # Initialize output raster
-    dst = np.empty((raster.count, dst_height, dst_width))
-    dst.fill(raster.meta["nodata"])
+    # GDAL initializes the whole destination when warping, so no need to pre-fill it
+    dst_dtype = get_output_dtype(raster.meta["nodata"], raster.dtypes[0])
+    dst = np.empty((raster.count, dst_height, dst_width), dtype=dst_dtype)
 
     out_image = warp.reproject(
         source=src_arr,
@@ -47,6 +48,7 @@ def _reproject_raster(
             "transform": dst_transform,
             "width": dst_width,
             "height": dst_height,
+            "dtype": dst_dtype.name,
         }
     )
 
@@ -68,7 +70,8 @@ def reproject_raster(
             Nearest, bilinear and cubic are some common choices. This parameter defaults to nearest.
 
     Returns:
-        The reprojected raster data.
+        The reprojected raster data. Keeps the data type of the input raster, so interpolated values of
+            integer rasters are rounded.
         The updated metadata.
 
     Raises:
@@ -8,6 +8,7 @@ from rasterio import warp
 from rasterio.enums import Resampling
 
 from eis_toolkit.exceptions import NumericValueSignException
+from eis_toolkit.utilities.raster import get_output_dtype
 
 RESAMPLE_METHOD_MAP = {
     "nearest": warp.Resampling.nearest,
@@ -32,8 +33,8 @@ def _resample(
     )
     out_transform = rasterio.Affine(resolution, 0, raster.transform[2], 0, -resolution, raster.transform[5])
 
-    dst = np.empty((raster.count, dst_height, dst_width))
-    dst.fill(raster.meta["nodata"])
+    dst_dtype = get_output_dtype(raster.meta["nodata"], raster.dtypes[0])
+    dst = np.empty((raster.count, dst_height, dst_width), dtype=dst_dtype)
 
     out_image = warp.reproject(
         source=raster.read(),
@@ -53,6 +54,7 @@ def _resample(
             "transform": out_transform,
             "width": out_image[0].shape[-1],
             "height": out_image[0].shape[-2],
+            "dtype": dst_dtype.name,
         }
     )
 
@@ -75,7 +77,8 @@ def resample(
             common choices. This parameter defaults to bilinear.
 
     Returns:
-        The resampled raster data.
+        The resampled raster data. Keeps the data type of the input raster, so interpolated values of
+            integer rasters are rounded.
         The updated metadata.
 
     Raises:
@@ -1,36 +1,66 @@
+import functools
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import rasterio
 import rasterio.profiles
 from beartype import beartype
-from beartype.typing import List, Literal, Optional, Sequence, Tuple
+from beartype.typing import Dict, List, Literal, Optional, Sequence, Tuple
 from rasterio import warp
 from rasterio.enums import Resampling
 from rasterio.profiles import Profile
+from rasterio.transform import array_bounds
+from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
 
 from eis_toolkit.exceptions import InvalidParameterValueException
 from eis_toolkit.raster_processing.resampling import RESAMPLE_METHOD_MAP
+from eis_toolkit.utilities.raster import get_output_dtype
+
+
+def _calculate_warp_scale(
+    src_crs: rasterio.crs.CRS,
+    src_transform: warp.Affine,
+    dst_crs: rasterio.crs.CRS,
+    dst_transform: warp.Affine,
+    dst_width: int,
+    dst_height: int,
+) -> Optional[Tuple[float, float]]:
+    # Ratio of destination to source pixel size over the whole destination grid. GDAL would otherwise
+    # estimate the resampling kernel scale separately for every chunk it warps, which makes the results
+    # of kernel-based resampling methods depend on the warp memory limit
+    dst_bounds = array_bounds(dst_height, dst_width, dst_transform)
+    left, bottom, right, top = warp.transform_bounds(dst_crs, src_crs, *dst_bounds, densify_pts=21)
+    src_width, src_height = right - left, top - bottom
+
+    # Leave the scale to GDAL if the destination grid cannot be transformed to the source CRS
+    if not (math.isfinite(src_width) and math.isfinite(src_height) and src_width > 0 and src_height > 0):
+        return None
+    return dst_width * abs(src_transform.a) / src_width, dst_height * abs(src_transform.e) / src_height
 
 
+# Grids are memoized across calls. Only unifying without masking computes them, and such calls are often
+# repeated for the same rasters and base grid, e.g. to compare resampling methods
+@functools.lru_cache(maxsize=128)
 def _calculate_snapped_grid(
-    raster: rasterio.io.DatasetReader, dst_crs: rasterio.crs.CRS, dst_resolution: Tuple[float, float]
+    src_crs: rasterio.crs.CRS,
+    src_transform: warp.Affine,
+    src_width: int,
+    src_height: int,
+    dst_crs: rasterio.crs.CRS,
+    dst_resolution: Tuple[float, float],
 ) -> Tuple[warp.Affine, int, int]:
+    src_bounds = array_bounds(src_height, src_width, src_transform)
     dst_transform, dst_width, dst_height = warp.calculate_default_transform(
-        raster.crs, dst_crs, raster.width, raster.height, *raster.bounds, resolution=dst_resolution
+        src_crs, dst_crs, src_width, src_height, *src_bounds, resolution=dst_resolution
     )
     # The created transform might not be aligned with the base raster grid, so
     # we still need to snap/align the transformation to closest grid corner
-    x_distance_to_grid = dst_transform.c % dst_resolution[0]
-    y_distance_to_grid = dst_transform.f % dst_resolution[1]
-
-    if x_distance_to_grid > dst_resolution[0] / 2:  # Snap towards right
-        c = dst_transform.c - x_distance_to_grid + dst_resolution[0]
-    else:  # Snap towards left
-        c = dst_transform.c - x_distance_to_grid
-
-    if y_distance_to_grid > dst_resolution[1] / 2:  # Snap towards up
-        f = dst_transform.f - y_distance_to_grid + dst_resolution[1]
-    else:  # Snap towards bottom
-        f = dst_transform.f - y_distance_to_grid
+    # Corners exactly halfway between grid lines snap towards left / bottom
+    c = math.ceil(dst_transform.c / dst_resolution[0] - 0.5) * dst_resolution[0]
+    f = math.ceil(dst_transform.f / dst_resolution[1] - 0.5) * dst_resolution[1]
 
     # Create new transform with updated corner coordinates
     dst_transform = warp.Affine(
@@ -66,61 +96,210 @@ def _mask_nodata(
         raster_array[mask] = nodata_value
 
 
+def _get_pixel_offset(
+    src_transform: warp.Affine,
+    src_width: int,
+    src_height: int,
+    dst_transform: warp.Affine,
+    dst_width: int,
+    dst_height: int,
+    resampling_method: Resampling,
+) -> Optional[Tuple[int, int]]:
+    # Destination grid offset in whole source pixels as (row, column), if the grids differ only by such a
+    # translation. Any resampling method reproduces the source for identical grids, but for shifted grids
+    # only nearest neighbour is guaranteed to, so other methods are left for GDAL
+    src_scale = (src_transform.a, src_transform.b, src_transform.d, src_transform.e)
+    dst_scale = (dst_transform.a, dst_transform.b, dst_transform.d, dst_transform.e)
+    if src_scale != dst_scale:
+        return None
+
+    col_off = (dst_transform.c - src_transform.c) / src_transform.a
+    row_off = (dst_transform.f - src_transform.f) / src_transform.e
+    if not (
+        math.isclose(col_off, round(col_off), abs_tol=1e-6) and math.isclose(row_off, round(row_off), abs_tol=1e-6)
+    ):
+        return None
+
+    pixel_offset = (round(row_off), round(col_off))
+    same_grid = pixel_offset == (0, 0) and (src_width, src_height) == (dst_width, dst_height)
+    if resampling_method != Resampling.nearest and not same_grid:
+        return None
+    return pixel_offset
+
+
+def _read_shifted_raster(
+    raster: rasterio.io.DatasetReader, band_image: np.ndarray, nodata: Optional[float], pixel_offset: Tuple[int, int]
+) -> None:
+    # Copy the overlapping part of the source straight into the destination and fill the rest with nodata
+    row_off, col_off = pixel_offset
+    row_start, row_stop = max(row_off, 0), min(row_off + band_image.shape[1], raster.height)
+    col_start, col_stop = max(col_off, 0), min(col_off + band_image.shape[2], raster.width)
+
+    overlaps = row_start < row_stop and col_start < col_stop
+    if not overlaps or (row_stop - row_start, col_stop - col_start) != band_image.shape[1:]:
+        # Like GDAL, leave pixels outside the source as zeros if there is no nodata value
+        band_image.fill(0 if nodata is None else nodata)
+
+    if overlaps:
+        overlap_image = band_image[
+            :, row_start - row_off : row_stop - row_off, col_start - col_off : col_stop - col_off  # noqa: E203
+        ]
+        raster.read(out=overlap_image, window=Window.from_slices((row_start, row_stop), (col_start, col_stop)))
+
+
+def _warp_rasters(
+    rasters: Sequence[rasterio.io.DatasetReader],
+    out_image: np.ndarray,
+    nodata: Optional[float],
+    dst_crs: rasterio.crs.CRS,
+    dst_transform: warp.Affine,
+    resampling_method: Resampling,
+    num_threads: int,
+    pixel_offset: Optional[Tuple[int, int]],
+    warp_scale: Optional[Tuple[float, float]],
+) -> None:
+    # Warp each raster straight into its own bands of the destination array. Reading
+    # through a warped VRT avoids loading the whole source raster into memory first.
+    # Large rasters are not tiled here: GDAL already warps the VRT block by block within
+    # the memory limit and spreads each block over the given number of threads
+    warp_extras = {"XSCALE": warp_scale[0], "YSCALE": warp_scale[1]} if warp_scale is not None else {}
+
+    band_offset = 0
+    for raster in rasters:
+        band_image = out_image[band_offset : band_offset + raster.count]  # noqa: E203
+        band_offset += raster.count
+
+        # Rasters on the destination grid or on a whole-pixel shift of it are read as they are,
+        # skipping the warp entirely
+        if pixel_offset is not None:
+            _read_shifted_raster(raster, band_image, nodata, pixel_offset)
+            continue
+
+        with WarpedVRT(
+            raster,
+            src_nodata=nodata,
+            crs=dst_crs,
+            transform=dst_transform,
+            width=out_image.shape[2],
+            height=out_image.shape[1],
+            nodata=nodata,
+            resampling=resampling_method,
+            dtype=out_image.dtype.name,
+            warp_mem_limit=512,
+            num_threads=num_threads,
+            **warp_extras,
+        ) as vrt:
+            vrt.read(out=band_image)
+
+
 def _unify_raster_grids(
     base_raster: rasterio.io.DatasetReader,
     rasters_to_unify: Sequence[rasterio.io.DatasetReader],
     resampling_method: Resampling,
     masking: Optional[Literal["extents", "full"]],
-) -> List[Tuple[np.ndarray, Profile]]:
+    num_threads: int,
+    read_base_raster: bool,
+) -> List[Tuple[Optional[np.ndarray], Profile]]:
 
     dst_crs = base_raster.crs
     dst_width = base_raster.width
     dst_height = base_raster.height
     dst_transform = base_raster.transform
-    dst_resolution = (base_raster.transform.a, abs(base_raster.transform.e))
+    dst_resolution = (dst_transform.a, abs(dst_transform.e))
 
-    base_raster_arr = base_raster.read()
-    base_raster_profile = base_raster.profile.copy()
-    out_rasters = [(base_raster_arr, base_raster_profile)]
+    # Dataset profiles are built anew on every access, so they are not copied separately
+    base_raster_arr = base_raster.read() if read_base_raster else None
+    base_raster_profile = base_raster.profile
+    base_raster_nodata = base_raster_profile.get("nodata", np.nan)
 
-    for raster in rasters_to_unify:
-        out_profile = raster.profile.copy()
+    # Rasters that share the source grid, data type and nodata value are unified together,
+    # so group them first. Order inside groups follows the input order. Dataset properties
+    # are looked up only once per raster here and reused from the group key below
+    groups: Dict[tuple, List[int]] = {}
+    for i, raster in enumerate(rasters_to_unify):
+        nodata = raster.nodata
+        if nodata is None:
+            nodata = base_raster_nodata
+        key = (raster.crs, raster.transform, raster.width, raster.height, raster.dtypes[0], nodata)
+        groups.setdefault(key, []).append(i)
+
+    warp_tasks = []
+    for (src_crs, src_transform, src_width, src_height, src_dtype, nodata), indices in groups.items():
+        group = [rasters_to_unify[i] for i in indices]
 
         # If we unify without clipping, things are more complicated and we need to
         # calculate corner coordinates, width and height, and snap the grid to nearest corner
         if not masking:
-            dst_transform, dst_width, dst_height = _calculate_snapped_grid(raster, dst_crs, dst_resolution)
+            dst_transform, dst_width, dst_height = _calculate_snapped_grid(
+                src_crs, src_transform, src_width, src_height, dst_crs, dst_resolution
+            )
 
-        dst_array = np.empty((base_raster.count, dst_height, dst_width))
-        base_raster_nodata = base_raster_profile.get("nodata", np.nan)
-        nodata = out_profile["nodata"]
-        if nodata is None:
-            nodata = base_raster_nodata
-            out_profile["nodata"] = base_raster_nodata
+        band_count = sum(raster.count for raster in group)
+        # Without a nodata value, full masking fills the masked pixels with NaN
+        dst_dtype = get_output_dtype(np.nan if nodata is None and masking == "full" else nodata, src_dtype)
+        # No need to initialize with nodata, reading the rasters writes every destination pixel
+        out_image = np.empty((band_count, dst_height, dst_width), dtype=dst_dtype)
+        pixel_offset = None
+        if src_crs == dst_crs:
+            pixel_offset = _get_pixel_offset(
+                src_transform, src_width, src_height, dst_transform, dst_width, dst_height, resampling_method
+            )
+        warp_scale = None
+        if pixel_offset is None:
+            warp_scale = _calculate_warp_scale(src_crs, src_transform, dst_crs, dst_transform, dst_width, dst_height)
+        warp_tasks.append((indices, group, out_image, nodata, dst_transform, pixel_offset, warp_scale))
 
-        dst_array.fill(nodata)
+    # GDAL releases the GIL while warping, so groups are warped in parallel threads. A dataset
+    # object always belongs to a single group and is never accessed from two threads at once
+    max_workers = min(num_threads, len(warp_tasks))
+    warp_threads = max(num_threads // max_workers, 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _warp_rasters,
+                group,
+                out_image,
+                nodata,
+                dst_crs,
+                dst_transform,
+                resampling_method,
+                warp_threads,
+                pixel_offset,
+                warp_scale,
+            )
+            for _, group, out_image, nodata, dst_transform, pixel_offset, warp_scale in warp_tasks
+        ]
+        for future in futures:
+            future.result()
 
-        src_array = raster.read()
+    if masking == "full":
+        # Only the first band is needed for the nodata mask, so read just that if base raster is not read anyway
+        base_raster_mask_arr = base_raster_arr if base_raster_arr is not None else base_raster.read([1])
 
-        out_image = warp.reproject(
-            source=src_array,
-            src_crs=raster.crs,
-            src_transform=raster.transform,
-            src_nodata=nodata,
-            destination=dst_array,
-            dst_crs=dst_crs,
-            dst_transform=dst_transform,
-            dst_nodata=nodata,
-            resampling=resampling_method,
-        )[0]
+    unified_rasters: List[Optional[Tuple[np.ndarray, Profile]]] = [None] * len(rasters_to_unify)
 
+    for indices, group, out_image, nodata, dst_transform, _, _ in warp_tasks:
         if masking == "full":
-            _mask_nodata(out_image, nodata, base_raster_arr, base_raster_profile)
+            _mask_nodata(out_image, nodata, base_raster_mask_arr, base_raster_profile)
 
-        out_profile.update({"transform": dst_transform, "width": dst_width, "height": dst_height, "crs": dst_crs})
+        out_images = np.split(out_image, np.cumsum([raster.count for raster in group])[:-1], axis=0)
 
-        out_rasters.append((out_image, out_profile))
+        for i, raster, image in zip(indices, group, out_images):
+            out_profile = raster.profile
+            out_profile.update(
+                {
+                    "transform": dst_transform,
+                    "width": image.shape[2],
+                    "height": image.shape[1],
+                    "crs": dst_crs,
+                    "nodata": nodata,
+                    "dtype": image.dtype.name,
+                }
+            )
+            unified_rasters[i] = (image, out_profile)
 
+    out_rasters = [(base_raster_arr, base_raster_profile)]
+    out_rasters.extend(unified_rasters)
     return out_rasters
 
 
@@ -130,7 +309,9 @@ def unify_raster_grids(
     rasters_to_unify: Sequence[rasterio.io.DatasetReader],
     resampling_method: Literal["nearest", "bilinear", "cubic", "average", "gauss", "max", "min"] = "nearest",
     masking: Optional[Literal["extents", "full"]] = "extents",
-) -> List[Tuple[np.ndarray, Profile]]:
+    num_threads: int = os.cpu_count() or 1,
+    read_base_raster: bool = True,
+) -> List[Tuple[Optional[np.ndarray], Profile]]:
     """Unifies given rasters with the base raster.
 
     Performs the following operations:
@@ -149,16 +330,21 @@ def unify_raster_grids(
             are matched with the base raster. Larger rasters are clipped and smaller rasters expanded (with nodata).
             If `full`, copies nodata pixel locations from the base raster additionally. If None,
             extents are not matched and nodata not copied. Defaults to `extents`.
+        num_threads: Number of threads GDAL uses for warping. Defaults to the number of CPUs available.
+        read_base_raster: If False, data of the base raster is not read and None is returned in its place.
+            Saves reading the base raster when only the unified rasters are needed. Defaults to True.
 
     Returns:
         List of unified rasters' data and profiles. First element is the base raster.
 
     Raises:
-        InvalidParameterValueException: Rasters to unify is empty.
+        InvalidParameterValueException: Rasters to unify is empty or number of threads is less than 1.
     """
     if len(rasters_to_unify) == 0:
         raise InvalidParameterValueException("Rasters to unify is empty.")
+    if num_threads < 1:
+        raise InvalidParameterValueException("Number of threads must be at least 1.")
 
     method = RESAMPLE_METHOD_MAP[resampling_method]
-    out_rasters = _unify_raster_grids(base_raster, rasters_to_unify, method, masking)
+    out_rasters = _unify_raster_grids(base_raster, rasters_to_unify, method, masking, num_threads, read_base_raster)
     return out_rasters
@@ -4,7 +4,7 @@ from numbers import Number
 import numpy as np
 import rasterio
 from beartype import beartype
-from beartype.typing import Literal, Sequence, Tuple, Union
+from beartype.typing import Literal, Optional, Sequence, Tuple, Union
 from rasterio import profiles, transform
 
 from eis_toolkit.exceptions import (
@@ -123,6 +123,32 @@ def stack_raster_arrays(arrays: Sequence[np.ndarray]) -> np.ndarray:
     return stacked_array
 
 
+@beartype
+def get_output_dtype(nodata: Optional[Number], dtype: Union[np.dtype, str]) -> np.dtype:
+    """
+    Get the data type for output raster data, keeping the input data type if possible.
+
+    The input data type is kept if it can represent the nodata value, otherwise float64 is used.
+
+    Args:
+        nodata: Nodata value of the output raster. None fits any data type.
+        dtype: Data type of the input raster.
+
+    Returns:
+        The output data type.
+    """
+    dtype = np.dtype(dtype)
+    if nodata is None:
+        return dtype
+    if np.issubdtype(dtype, np.integer):
+        dtype_info = np.iinfo(dtype)
+        if float(nodata).is_integer() and dtype_info.min <= nodata <= dtype_info.max:
+            return dtype
+    elif np.isnan(nodata) or abs(nodata) <= np.finfo(dtype).max:
+        return dtype
+    return np.dtype(np.float64)
+
+
 @beartype
 def profile_from_extent_and_pixel_size(
     extent: Tuple[Number, Number, Number, Number],
@@ -10,6 +10,7 @@ from eis_toolkit.prediction.gradient_boosting import (
 )
 
 X_IRIS, Y_IRIS = load_iris(return_X_y=True)
+TRAIN_FUNCTIONS = [gradient_boosting_classifier_train, gradient_boosting_regressor_train]
 
 
 def test_gradient_boosting_classifier():
@@ -46,33 +47,29 @@ def test_gradient_boosting_regressor():
     np.testing.assert_equal(out_metrics["r2"], 0.994)
 
 
-def test_invalid_learning_rate():
+@pytest.mark.parametrize("train_function", TRAIN_FUNCTIONS)
+def test_invalid_learning_rate(train_function):
     """Test that invalid value for learning rate raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_classifier_train(X_IRIS, Y_IRIS, learning_rate=-1)
-    with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_regressor_train(X_IRIS, Y_IRIS, learning_rate=-1)
+        train_function(X_IRIS, Y_IRIS, learning_rate=-1)
 
 
-def test_invalid_n_estimators():
+@pytest.mark.parametrize("train_function", TRAIN_FUNCTIONS)
+def test_invalid_n_estimators(train_function):
     """Test that invalid value for n estimators raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_classifier_train(X_IRIS, Y_IRIS, n_estimators=0)
-    with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_regressor_train(X_IRIS, Y_IRIS, n_estimators=0)
+        train_function(X_IRIS, Y_IRIS, n_estimators=0)
 
 
-def test_invalid_max_depth():
+@pytest.mark.parametrize("train_function", TRAIN_FUNCTIONS)
+def test_invalid_max_depth(train_function):
     """Test that invalid value for max depth raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_classifier_train(X_IRIS, Y_IRIS, max_depth=0)
-    with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_regressor_train(X_IRIS, Y_IRIS, max_depth=0)
+        train_function(X_IRIS, Y_IRIS, max_depth=0)
 
 
-def test_invalid_subsample():
+@pytest.mark.parametrize("train_function", TRAIN_FUNCTIONS)
+def test_invalid_subsample(train_function):
     """Test that invalid value for subsample raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_classifier_train(X_IRIS, Y_IRIS, subsample=0)
-    with pytest.raises(InvalidParameterValueException):
-        gradient_boosting_regressor_train(X_IRIS, Y_IRIS, subsample=0)
+        train_function(X_IRIS, Y_IRIS, subsample=0)
@@ -20,30 +20,35 @@ TEST_DIR = Path(__file__).parent.parent
 
 X_IRIS, Y_IRIS = load_iris(return_X_y=True)
 
-RF_MODEL = RandomForestClassifier()
 CLF_METRICS = ["accuracy", "precision", "recall", "f1"]
 REGR_METRICS = ["mse", "rmse", "mae", "r2"]
 
 
+@pytest.fixture
+def rf_model():
+    """Return an unfitted Random Forest classifier, created anew for each test."""
+    return RandomForestClassifier(n_estimators=10, max_depth=5, n_jobs=-1, random_state=42)
+
+
 # NOTE: Testing loo_cv has been left out since it takes a lot longer than the other cv methods
 
 
-def test_train_and_evaluate_with_no_validation():
+def test_train_and_evaluate_with_no_validation(rf_model):
     """Test that training a model without evaluation works as expected."""
     model, out_metrics = _train_and_validate_sklearn_model(
-        X_IRIS, Y_IRIS, model=RF_MODEL, validation_method="none", metrics=CLF_METRICS, random_state=42
+        X_IRIS, Y_IRIS, model=rf_model, validation_method="none", metrics=CLF_METRICS, random_state=42
     )
 
     assert isinstance(model, RandomForestClassifier)
     assert not out_metrics
 
 
-def test_train_and_evaluate_with_split():
+def test_train_and_evaluate_with_split(rf_model):
     """Test that training a model with split validation works as expected."""
     model, out_metrics = _train_and_validate_sklearn_model(
         X_IRIS,
         Y_IRIS,
-        model=RF_MODEL,
+        model=rf_model,
         validation_method="split",
         metrics=CLF_METRICS,
         split_size=0.25,
@@ -54,27 +59,27 @@ def test_train_and_evaluate_with_split():
     np.testing.assert_equal(len(out_metrics), 4)
 
 
-def test_train_and_evaluate_with_kfold_cv():
+def test_train_and_evaluate_with_kfold_cv(rf_model):
     """Test that training a model with k-fold cross-validation works as expected."""
     model, out_metrics = _train_and_validate_sklearn_model(
-        X_IRIS, Y_IRIS, model=RF_MODEL, validation_method="kfold_cv", metrics=CLF_METRICS, cv_folds=3, random_state=42
+        X_IRIS, Y_IRIS, model=rf_model, validation_method="kfold_cv", metrics=CLF_METRICS, cv_folds=3, random_state=42
     )
 
     assert isinstance(model, RandomForestClassifier)
     np.testing.assert_equal(len(out_metrics), 4)
 
 
-def test_train_and_evaluate_with_skfold_cv():
+def test_train_and_evaluate_with_skfold_cv(rf_model):
     """Test that training a model with stratified k-fold cross-validation works as expected."""
     model, out_metrics = _train_and_validate_sklearn_model(
-        X_IRIS, Y_IRIS, model=RF_MODEL, validation_method="skfold_cv", metrics=CLF_METRICS, cv_folds=3, random_state=42
+        X_IRIS, Y_IRIS, model=rf_model, validation_method="skfold_cv", metrics=CLF_METRICS, cv_folds=3, random_state=42
     )
 
     assert isinstance(model, RandomForestClassifier)
     np.testing.assert_equal(len(out_metrics), 4)
 
 
-def test_binary_classification():
+def test_binary_classification(rf_model):
     """Test that training with binary data works as expected."""
     X_binary = np.array(
         [
@@ -90,7 +95,7 @@ def test_binary_classification():
     model, out_metrics = _train_and_validate_sklearn_model(
         X_binary,
         y_binary,
-        model=RF_MODEL,
+        model=rf_model,
         validation_method="kfold_cv",
         metrics=CLF_METRICS,
         cv_folds=3,
@@ -110,12 +115,12 @@ def test_splitting():
     np.testing.assert_equal(len(y_test), len(Y_IRIS) * 0.2)
 
 
-def test_evaluate_model_sklearn():
+def test_evaluate_model_sklearn(rf_model):
     """Test that evaluating model works as expected with a Sklearn model."""
     X_train, X_test, y_train, y_test = split_data(X_IRIS, Y_IRIS, split_size=0.2, random_state=42)
 
     model, _ = _train_and_validate_sklearn_model(
-        X_train, y_train, model=RF_MODEL, validation_method="none", metrics=CLF_METRICS, random_state=42
+        X_train, y_train, model=rf_model, validation_method="none", metrics=CLF_METRICS, random_state=42
     )
 
     predictions = predict_classifier(X_test, model, classification_threshold=0.5, include_probabilities=False)
@@ -123,12 +128,12 @@ def test_evaluate_model_sklearn():
     np.testing.assert_equal(accuracy, 1.0)
 
 
-def test_predict_classifier_sklearn():
+def test_predict_classifier_sklearn(rf_model):
     """Test that predicting with classifier works as expected with a Sklearn model."""
     X_train, X_test, y_train, y_test = split_data(X_IRIS, Y_IRIS, split_size=0.2, random_state=42)
 
     model, _ = _train_and_validate_sklearn_model(
-        X_train, y_train, model=RF_MODEL, validation_method="none", metrics=CLF_METRICS, random_state=42
+        X_train, y_train, model=rf_model, validation_method="none", metrics=CLF_METRICS, random_state=42
     )
 
     predicted_labels, predicted_probabilities = predict_classifier(X_test, model, include_probabilities=True)
@@ -136,41 +141,41 @@ def test_predict_classifier_sklearn():
     np.testing.assert_equal(len(predicted_probabilities), len(y_test))
 
 
-def test_save_and_load_model():
+def test_save_and_load_model(rf_model):
     """Test that saving and loading a model works as expected."""
     model_save_path = TEST_DIR.joinpath("data/local/results/saved_rf_model.joblib")
 
-    save_model(RF_MODEL, model_save_path)
+    save_model(rf_model, model_save_path)
     assert exists(model_save_path)
     loaded_rf_model = load_model(model_save_path)
     assert isinstance(loaded_rf_model, RandomForestClassifier)
 
 
-def test_mismatching_X_and_y():
+def test_mismatching_X_and_y(rf_model):
     """Test that invalid lengths for X and y raises the correct exception."""
     with pytest.raises(NonMatchingParameterLengthsException):
         _train_and_validate_sklearn_model(
-            X_IRIS, Y_IRIS[:-1], model=RF_MODEL, validation_method="none", metrics=CLF_METRICS
+            X_IRIS, Y_IRIS[:-1], model=rf_model, validation_method="none", metrics=CLF_METRICS
         )
 
 
-def test_invalid_metrics():
+def test_invalid_metrics(rf_model):
     """Test that invalid metric selection raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
-        _train_and_validate_sklearn_model(X_IRIS, Y_IRIS, model=RF_MODEL, validation_method="split", metrics=[])
+        _train_and_validate_sklearn_model(X_IRIS, Y_IRIS, model=rf_model, validation_method="split", metrics=[])
 
 
-def test_invalid_cv_folds():
+def test_invalid_cv_folds(rf_model):
     """Test that invalid metric selection raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
         _train_and_validate_sklearn_model(
-            X_IRIS, Y_IRIS, model=RF_MODEL, validation_method="kfold_cv", metrics=CLF_METRICS, cv_folds=1
+            X_IRIS, Y_IRIS, model=rf_model, validation_method="kfold_cv", metrics=CLF_METRICS, cv_folds=1
         )
 
 
-def test_invalid_split_size():
+def test_invalid_split_size(rf_model):
     """Test that invalid metric selection raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
         _train_and_validate_sklearn_model(
-            X_IRIS, Y_IRIS, model=RF_MODEL, validation_method="split", metrics=CLF_METRICS, split_size=0.0
+            X_IRIS, Y_IRIS, model=rf_model, validation_method="split", metrics=CLF_METRICS, split_size=0.0
         )
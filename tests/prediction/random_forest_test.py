@@ -7,12 +7,13 @@ from eis_toolkit.exceptions import InvalidParameterValueException
 from eis_toolkit.prediction.random_forests import random_forest_classifier_train, random_forest_regressor_train
 
 X_IRIS, Y_IRIS = load_iris(return_X_y=True)
+TRAIN_FUNCTIONS = [random_forest_classifier_train, random_forest_regressor_train]
 
 
 def test_random_forest_classifier():
     """Test that Random Forest classifier works as expected."""
     metrics = ["accuracy", "precision", "recall", "f1"]
-    model, out_metrics = random_forest_classifier_train(X_IRIS, Y_IRIS, metrics=metrics, random_state=42)
+    model, out_metrics = random_forest_classifier_train(X_IRIS, Y_IRIS, metrics=metrics, random_state=42, n_jobs=-1)
     predicted_labels = model.predict(X_IRIS)
     count_false = np.count_nonzero(predicted_labels - Y_IRIS)
 
@@ -29,7 +30,7 @@ def test_random_forest_classifier():
 def test_random_forest_regressor():
     """Test that Random Forest regressor works as expected."""
     metrics = ["mae", "mse", "rmse", "r2"]
-    model, out_metrics = random_forest_regressor_train(X_IRIS, Y_IRIS, metrics=metrics, random_state=42)
+    model, out_metrics = random_forest_regressor_train(X_IRIS, Y_IRIS, metrics=metrics, random_state=42, n_jobs=-1)
     predicted_labels = model.predict(X_IRIS)
     count_false = np.count_nonzero(predicted_labels - Y_IRIS)
 
@@ -43,9 +44,8 @@ def test_random_forest_regressor():
     np.testing.assert_equal(out_metrics["r2"], 0.998)
 
 
-def test_random_forest_invalid_n_estimators():
+@pytest.mark.parametrize("train_function", TRAIN_FUNCTIONS)
+def test_random_forest_invalid_n_estimators(train_function):
     """Test that invalid value for n estimators raises the correct exception."""
     with pytest.raises(InvalidParameterValueException):
-        random_forest_classifier_train(X_IRIS, Y_IRIS, n_estimators=0)
-    with pytest.raises(InvalidParameterValueException):
-        random_forest_regressor_train(X_IRIS, Y_IRIS, n_estimators=0)
+        train_function(X_IRIS, Y_IRIS, n_estimators=0)
@@ -25,3 +25,30 @@ def test_mask_raster():
             np.testing.assert_array_equal(
                 base_raster.read(1) == base_raster.nodata, out_image[0] == out_profile["nodata"]
             )
+
+
+def test_mask_raster_without_nodata():
+    """Test that masked pixels are set to NaN in a float64 copy of an integer raster without nodata."""
+    with rasterio.open(small_raster_clipped_path) as base_raster:
+        base_profile = base_raster.profile.copy()
+        base_image = base_raster.read()
+        base_image[base_image == base_raster.nodata] = np.nan
+    base_profile.update({"nodata": None})
+    base_memory_file = rasterio.MemoryFile()
+    with base_memory_file.open(**base_profile) as dst:
+        dst.write(base_image)
+
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        profile = raster.profile.copy()
+        image = (raster.read() * 10).astype(np.uint8)
+    profile.update({"dtype": "uint8", "nodata": None})
+    memory_file = rasterio.MemoryFile()
+    with memory_file.open(**profile) as dst:
+        dst.write(image)
+
+    with memory_file.open() as raster, base_memory_file.open() as base_raster:
+        out_image, out_profile = mask_raster(raster, base_raster)
+
+    assert out_image.dtype == np.float64
+    assert out_profile["dtype"] == "float64"
+    np.testing.assert_array_equal(np.isnan(out_image[0]), np.isnan(base_image[0]))
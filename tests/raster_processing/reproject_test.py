@@ -45,3 +45,19 @@ def test_same_crs():
     with pytest.raises(MatchingCrsException):
         with rasterio.open(SMALL_RASTER_PATH) as raster:
             reproject_raster(raster, int(raster.crs.to_string()[5:]))
+
+
+@pytest.mark.parametrize("dtype, nodata", [("uint8", None), ("uint8", 255), ("float32", -9999)])
+def test_reproject_data_type(dtype, nodata):
+    """Test that the data type of the input raster is kept."""
+    profile = src_raster.profile
+    profile.update({"dtype": dtype, "nodata": nodata})
+    memory_file = rasterio.MemoryFile()
+    with memory_file.open(**profile) as dst:
+        dst.write(np.clip(src_raster.read(), 0, 254).astype(dtype))
+
+    with memory_file.open() as raster:
+        out_image, out_meta = reproject_raster(raster, 4326)
+
+    assert out_image.dtype == dtype
+    assert out_meta["dtype"] == dtype
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import rasterio
 from rasterio import Affine
@@ -29,3 +30,20 @@ def test_resample_negative_upscale_factor():
     with pytest.raises(NumericValueSignException):
         with rasterio.open(SMALL_RASTER_PATH) as raster:
             resample(raster=raster, resolution=-2, resampling_method="cubic")
+
+
+@pytest.mark.parametrize("dtype, nodata", [("uint8", None), ("uint8", 255), ("float32", -9999)])
+def test_resample_data_type(dtype, nodata):
+    """Test that the data type of the input raster is kept."""
+    with rasterio.open(SMALL_RASTER_PATH) as raster:
+        profile = raster.profile
+        profile.update({"dtype": dtype, "nodata": nodata})
+        memory_file = rasterio.MemoryFile()
+        with memory_file.open(**profile) as dst:
+            dst.write(np.clip(raster.read(), 0, 254).astype(dtype))
+
+    with memory_file.open() as raster:
+        out_image, out_meta = resample(raster, 6, resampling_method="bilinear")
+
+    assert out_image.dtype == dtype
+    assert out_meta["dtype"] == dtype
@@ -3,9 +3,11 @@ from pathlib import Path
 import numpy as np
 import pytest
 import rasterio
+from rasterio import warp
+from rasterio.transform import from_bounds
 
 from eis_toolkit.exceptions import InvalidParameterValueException
-from eis_toolkit.raster_processing.unifying import unify_raster_grids
+from eis_toolkit.raster_processing.unifying import _calculate_warp_scale, unify_raster_grids
 from tests.raster_processing.masking_test import small_raster_clipped_path as base_raster_path_3
 
 test_dir = Path(__file__).parent.parent
@@ -112,8 +114,195 @@ def test_unify_raster_grids_full_masking():
         dst.write(out_image)
 
 
+def test_unify_raster_grids_multiple_rasters():
+    """Test that rasters sharing a grid are unified identically to unifying them one by one."""
+    with rasterio.open(raster_to_unify_path_1) as raster_1, rasterio.open(raster_to_unify_path_2) as raster_2:
+        with rasterio.open(base_raster_path_1) as base_raster:
+            out_rasters = unify_raster_grids(base_raster, [raster_1, raster_2, raster_1], "bilinear", masking=None)
+            single_image_1, single_meta_1 = unify_raster_grids(base_raster, [raster_1], "bilinear", masking=None)[1]
+            single_image_2, single_meta_2 = unify_raster_grids(base_raster, [raster_2], "bilinear", masking=None)[1]
+
+    assert len(out_rasters) == 4
+    np.testing.assert_array_equal(out_rasters[1][0], single_image_1)
+    np.testing.assert_array_equal(out_rasters[2][0], single_image_2)
+    np.testing.assert_array_equal(out_rasters[3][0], single_image_1)
+    assert out_rasters[1][1] == single_meta_1
+    assert out_rasters[2][1] == single_meta_2
+    assert out_rasters[3][1] == single_meta_1
+    # Profiles of rasters in the same group must not be shared
+    assert out_rasters[1][1] is not out_rasters[3][1]
+    # Rasters unified together are returned as contiguous arrays
+    assert all(out_image.flags["C_CONTIGUOUS"] for out_image, _ in out_rasters)
+
+
+def test_unify_raster_grids_same_grid():
+    """Test that a raster already on the base raster grid is returned unchanged."""
+    with rasterio.open(base_raster_path_1) as raster_to_unify:
+        with rasterio.open(base_raster_path_1) as base_raster:
+            out_image, out_profile = unify_raster_grids(base_raster, [raster_to_unify], "bilinear")[1]
+
+            np.testing.assert_array_equal(out_image, base_raster.read())
+            assert out_profile == base_raster.profile
+
+
+def test_unify_raster_grids_shifted_grid():
+    """Test that rasters on a whole-pixel shift of the base raster grid are clipped and expanded correctly."""
+    with rasterio.open(base_raster_path_1) as larger_raster:
+        with rasterio.open(base_raster_path_2) as smaller_raster:
+            clipped_image, clipped_profile = unify_raster_grids(smaller_raster, [larger_raster])[1]
+            expanded_image, expanded_profile = unify_raster_grids(larger_raster, [smaller_raster])[1]
+
+            # Smaller raster starts 4 pixels right and 6 pixels down from the larger raster
+            np.testing.assert_array_equal(clipped_image, larger_raster.read()[:, 6:42, 4:36])
+            assert clipped_profile["transform"] == smaller_raster.transform
+            np.testing.assert_array_equal(expanded_image[:, 6:42, 4:36], smaller_raster.read())
+            expanded_image[:, 6:42, 4:36] = larger_raster.nodata
+            assert np.all(expanded_image == larger_raster.nodata)
+            assert expanded_profile["transform"] == larger_raster.transform
+
+
+def test_unify_raster_grids_without_reading_base_raster():
+    """Test that skipping reading of the base raster does not affect the unified rasters."""
+    with rasterio.open(raster_to_unify_path_1) as raster_to_unify:
+        with rasterio.open(base_raster_path_3) as base_raster:
+            out_rasters = unify_raster_grids(base_raster, [raster_to_unify], masking="full", read_base_raster=False)
+            expected_image, expected_profile = unify_raster_grids(base_raster, [raster_to_unify], masking="full")[1]
+
+    assert out_rasters[0][0] is None
+    np.testing.assert_array_equal(out_rasters[1][0], expected_image)
+    assert out_rasters[1][1] == expected_profile
+
+
+def test_unify_raster_grids_data_type():
+    """Test that the data type of the raster to unify is kept when its nodata value fits the type."""
+    with rasterio.open(raster_to_unify_path_1) as raster_to_unify:
+        profile = raster_to_unify.profile.copy()
+        profile.update({"dtype": "uint8", "nodata": 255})
+        memory_file = rasterio.MemoryFile()
+        with memory_file.open(**profile) as dst:
+            dst.write(np.clip(raster_to_unify.read(), 0, 254).astype(np.uint8))
+
+    with memory_file.open() as raster_to_unify:
+        with rasterio.open(base_raster_path_1) as base_raster:
+            out_image, out_profile = unify_raster_grids(base_raster, [raster_to_unify], "nearest", masking=None)[1]
+
+    assert out_image.dtype == np.uint8
+    assert out_profile["dtype"] == "uint8"
+    assert out_profile["nodata"] == 255
+
+
+@pytest.mark.parametrize("resampling_method", ["nearest", "bilinear"])
+def test_unify_raster_grids_full_masking_without_nodata(resampling_method):
+    """Test that full masking sets NaN to a float64 copy of an integer raster when no nodata value is defined."""
+    with rasterio.open(base_raster_path_3) as base_raster:
+        base_profile = base_raster.profile.copy()
+        base_image = base_raster.read()
+        base_image[base_image == base_raster.nodata] = np.nan
+    base_profile.update({"nodata": None})
+    base_memory_file = rasterio.MemoryFile()
+    with base_memory_file.open(**base_profile) as dst:
+        dst.write(base_image)
+
+    with rasterio.open(raster_to_unify_path_1) as raster_to_unify:
+        profile = raster_to_unify.profile.copy()
+        image = (raster_to_unify.read() * 50).astype(np.uint8)
+    profile.update({"dtype": "uint8", "nodata": None})
+    memory_file = rasterio.MemoryFile()
+    with memory_file.open(**profile) as dst:
+        dst.write(image)
+
+    with memory_file.open() as raster_to_unify, base_memory_file.open() as base_raster:
+        out_image, out_profile = unify_raster_grids(base_raster, [raster_to_unify], resampling_method, masking="full")[
+            1
+        ]
+
+    assert out_image.dtype == np.float64
+    assert out_profile["dtype"] == "float64"
+    np.testing.assert_array_equal(np.isnan(out_image[0]), np.isnan(base_image[0]))
+
+
+def test_unify_raster_grids_antimeridian():
+    """Test that a raster crossing the antimeridian keeps its full extent when unified to geographic coordinates."""
+    base_memory_file = rasterio.MemoryFile()
+    with base_memory_file.open(
+        driver="GTiff",
+        width=360,
+        height=180,
+        count=1,
+        dtype="float32",
+        crs="EPSG:4326",
+        transform=from_bounds(-180, -90, 180, 90, 360, 180),
+        nodata=-1,
+    ) as dst:
+        dst.write(np.ones((1, 180, 360), dtype=np.float32))
+
+    raster_memory_file = rasterio.MemoryFile()
+    with raster_memory_file.open(
+        driver="GTiff",
+        width=60,
+        height=100,
+        count=1,
+        dtype="float32",
+        crs="EPSG:32601",
+        transform=from_bounds(200000, 5000000, 800000, 6000000, 60, 100),
+        nodata=-1,
+    ) as dst:
+        dst.write(np.ones((1, 100, 60), dtype=np.float32))
+
+    with base_memory_file.open() as base_raster, raster_memory_file.open() as raster_to_unify:
+        out_image, out_profile = unify_raster_grids(base_raster, [raster_to_unify], masking=None)[1]
+
+    # UTM zone 1 spans the antimeridian, so the output covers the whole longitude range
+    assert out_image.shape == (1, 10, 359)
+    assert out_profile["transform"].c == -180
+    assert np.count_nonzero(out_image != -1) == 65
+
+
+def test_calculate_warp_scale():
+    """Test that the warp scale is the ratio of source to destination pixel size."""
+    with rasterio.open(base_raster_path_1) as raster:
+        dst_transform = raster.transform * warp.Affine.scale(4)
+        warp_scale = _calculate_warp_scale(
+            raster.crs, raster.transform, raster.crs, dst_transform, raster.width // 4, raster.height // 4
+        )
+
+    np.testing.assert_allclose(warp_scale, (0.25, 0.25))
+
+
+@pytest.mark.parametrize(
+    "masking, expected_mean, expected_pixels",
+    [
+        ("extents", 1.835589, (1.995919, 1.449764)),
+        (None, 1.752792, (2.192608, 1.583189)),
+    ],
+)
+def test_unify_raster_grids_bilinear_values(masking, expected_mean, expected_pixels):
+    """Test that bilinear resampling with the fixed warp scale produces the expected values."""
+    with rasterio.open(raster_to_unify_path_1) as raster_to_unify:
+        with rasterio.open(base_raster_path_1) as base_raster:
+            out_image, out_profile = unify_raster_grids(base_raster, [raster_to_unify], "bilinear", masking=masking)[1]
+
+    valid_values = out_image[out_image != out_profile["nodata"]]
+    np.testing.assert_almost_equal(valid_values.mean(), expected_mean, decimal=5)
+    np.testing.assert_almost_equal((out_image[0, 20, 20], out_image[0, 30, 25]), expected_pixels, decimal=5)
+
+
+def test_calculate_warp_scale_degenerate_bounds():
+    """Test that a destination grid with no extent leaves the warp scale to GDAL."""
+    with rasterio.open(base_raster_path_1) as raster:
+        assert _calculate_warp_scale(raster.crs, raster.transform, raster.crs, raster.transform, 0, 0) is None
+
+
 def test_unify_raster_grids_empty_raster_list():
     """Test that empty raster list raises correct exception."""
     with pytest.raises(InvalidParameterValueException):
         with rasterio.open(base_raster_path_1) as base_raster:
             _ = unify_raster_grids(base_raster, [])
+
+
+def test_unify_raster_grids_invalid_num_threads():
+    """Test that invalid number of threads raises correct exception."""
+    with pytest.raises(InvalidParameterValueException):
+        with rasterio.open(raster_to_unify_path_1) as raster_to_unify:
+            with rasterio.open(base_raster_path_1) as base_raster:
+                _ = unify_raster_grids(base_raster, [raster_to_unify], num_threads=0)
@@ -1,11 +1,13 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 import rasterio
 from rasterio import profiles
 
 from eis_toolkit.utilities.raster import (
     combine_raster_bands,
+    get_output_dtype,
     profile_from_extent_and_pixel_size,
     split_raster_bands,
     stack_raster_arrays,
@@ -64,3 +66,23 @@ def test_profile_from_extent_and_pixel_size():
     np.testing.assert_equal(raster_profile["height"], profile["height"])
     np.testing.assert_equal(raster_profile["width"], profile["width"])
     np.testing.assert_equal(raster_profile["transform"], profile["transform"])
+
+
+@pytest.mark.parametrize(
+    "nodata, dtype, expected_dtype",
+    [
+        (None, "uint8", "uint8"),
+        (None, "float32", "float32"),
+        (255, "uint8", "uint8"),
+        (-9999.0, "int16", "int16"),
+        (np.nan, "float32", "float32"),
+        (-9999, "float32", "float32"),
+        (-1, "uint8", "float64"),
+        (256, "uint8", "float64"),
+        (-999.999, "int32", "float64"),
+        (np.nan, "int16", "float64"),
+    ],
+)
+def test_get_output_dtype(nodata, dtype, expected_dtype):
+    """Test that the input data type is kept unless it cannot represent the nodata value."""
+    assert get_output_dtype(nodata, dtype) == expected_dtype